@@ -1,24 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import pathlib
-import random
 import typing
 from dataclasses import dataclass, field
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict, Generator, Tuple
-from uuid import UUID
 
 import fsspec
 import msgpack
-from dataclasses_json import DataClassJsonMixin, config
+from dataclasses_json import config
 from fsspec.utils import get_protocol
 from google.protobuf import json_format as _json_format
 from google.protobuf.struct_pb2 import Struct
 from marshmallow import fields
+from mashumaro.mixins.json import DataClassJSONMixin
 from mashumaro.types import SerializableType
 
 from flytekit.core.constants import MESSAGEPACK
@@ -49,8 +47,41 @@ PathType = typing.Union[str, os.PathLike]
 def noop(): ...
 
 
+# Schemes that FileAccessProvider.is_remote always reports as remote. Checking these prefixes directly avoids a round
+# trip through fsspec's protocol parsing for the paths FlyteDirectory sees most often.
+_REMOTE_SCHEMES = ("s3://", "gs://", "http://", "https://", "abfs://", "az://", "azure://", "gcs://")
+
+
+def _fast_is_remote(path: PathType) -> typing.Optional[bool]:
+    """
+    Returns True or False when the answer is obvious from the path alone, and None when the caller should fall back to
+    FileAccessProvider.is_remote.
+    """
+    if not isinstance(path, str):
+        return None
+    if path.startswith(_REMOTE_SCHEMES):
+        return True
+    if path.startswith("/") and ":" not in path:
+        return False
+    return None
+
+
+def _is_remote(file_access, path: PathType) -> bool:
+    fast = _fast_is_remote(path)
+    if fast is None:
+        return file_access.is_remote(path)
+    return fast
+
+
+# Literal models are never mutated after construction, so the metadata for format-less multipart blobs can be shared
+# by every literal built from a bare path.
+_EMPTY_FORMAT_MULTIPART_METADATA = BlobMetadata(
+    type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.MULTIPART)
+)
+
+
 @dataclass
-class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.Generic[T]):
+class FlyteDirectory(SerializableType, DataClassJSONMixin, os.PathLike, typing.Generic[T]):
     path: PathType = field(default=None, metadata=config(mm_field=fields.String()))  # type: ignore
     """
     > [!WARNING]
@@ -137,42 +168,39 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
     field in the ``BlobType``.
     """
 
+    def _serialized_uri(self) -> str:
+        # These are the cases in which async_to_literal returns the uri without uploading anything, so the transformer
+        # (and its event loop round trip) is only needed when the directory may actually have to be uploaded.
+        if self._remote_source is not None:
+            return self._remote_source
+        if (
+            isinstance(self.path, str)
+            and _fast_is_remote(self.path)
+            and not isinstance(self._remote_directory, (pathlib.Path, str))
+        ):
+            return self.path
+        lv = _flyte_dir_transformer.to_literal(FlyteContextManager.current_context(), self, type(self), None)
+        return lv.scalar.blob.uri
+
     def _serialize(self) -> typing.Dict[str, str]:
-        lv = FlyteDirToMultipartBlobTransformer().to_literal(
-            FlyteContextManager.current_context(), self, type(self), None
-        )
-        return {"path": lv.scalar.blob.uri}
+        return {"path": self._serialized_uri()}
 
     @classmethod
     def _deserialize(cls, value) -> "FlyteDirectory":
-        return FlyteDirToMultipartBlobTransformer().dict_to_flyte_directory(dict_obj=value, expected_python_type=cls)
+        return _flyte_dir_transformer.dict_to_flyte_directory(dict_obj=value, expected_python_type=cls)
 
     @model_serializer
     def serialize_flyte_dir(self) -> Dict[str, str]:
-        lv = FlyteDirToMultipartBlobTransformer().to_literal(
-            FlyteContextManager.current_context(), self, type(self), None
-        )
-        return {"path": lv.scalar.blob.uri}
+        return {"path": self._serialized_uri()}
 
     @model_validator(mode="after")
     def deserialize_flyte_dir(self, info) -> FlyteDirectory:
         if info.context is None or info.context.get("deserialize") is not True:
             return self
 
-        pv = FlyteDirToMultipartBlobTransformer().to_python_value(
+        pv = _flyte_dir_transformer.to_python_value(
             FlyteContextManager.current_context(),
-            Literal(
-                scalar=Scalar(
-                    blob=Blob(
-                        metadata=BlobMetadata(
-                            type=_core_types.BlobType(
-                                format="", dimensionality=_core_types.BlobType.BlobDimensionality.MULTIPART
-                            )
-                        ),
-                        uri=self.path,
-                    )
-                )
-            ),
+            Literal(scalar=Scalar(blob=Blob(metadata=_EMPTY_FORMAT_MULTIPART_METADATA, uri=self.path))),
             type(self),
         )
         return pv
@@ -269,27 +297,7 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
         if item_string == "":
             return cls
 
-        class _SpecificFormatDirectoryClass(FlyteDirectory):
-            # Get the type engine to see this as kind of a generic
-            __origin__ = FlyteDirectory
-
-            class AttributeHider:
-                def __get__(self, instance, owner):
-                    raise AttributeError(
-                        """We have to return false in hasattr(cls, "__class_getitem__") to make mashumaro deserialize FlyteDirectory correctly."""
-                    )
-
-            # Set __class_getitem__ to AttributeHider to make mashumaro deserialize FlyteDirectory correctly
-            # https://stackoverflow.com/questions/6057130/python-deleting-a-class-attribute-in-a-subclass/6057409
-            # Since mashumaro will use the method __class_getitem__ and __origin__ to construct the dataclass back
-            # https://github.com/Fatal1ty/mashumaro/blob/e945ee4319db49da9f7b8ede614e988cc8c8956b/mashumaro/core/meta/helpers.py#L300-L303
-            __class_getitem__ = AttributeHider()  # type: ignore
-
-            @classmethod
-            def extension(cls) -> str:
-                return item_string
-
-        return _SpecificFormatDirectoryClass
+        return _specific_format_directory_class(item_string)
 
     @property
     def downloaded(self) -> bool:
@@ -321,8 +329,9 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
         """
         # TODO we may want to use - https://github.com/fsspec/universal_pathlib
         if not name:
-            name = UUID(int=random.getrandbits(128)).hex
-        new_path = self.sep.join([str(self.path).rstrip(self.sep), name])  # trim trailing sep if any and join
+            name = os.urandom(16).hex()
+        sep = self.sep
+        new_path = f"{str(self.path).rstrip(sep)}{sep}{name}"  # trim trailing sep if any and join
         return FlyteFile(path=new_path)
 
     def new_dir(self, name: typing.Optional[str] = None) -> FlyteDirectory:
@@ -332,9 +341,10 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
         Collisions are not checked.
         """
         if not name:
-            name = UUID(int=random.getrandbits(128)).hex
+            name = os.urandom(16).hex()
 
-        new_path = self.sep.join([str(self.path).rstrip(self.sep), name])  # trim trailing sep if any and join
+        sep = self.sep
+        new_path = f"{str(self.path).rstrip(sep)}{sep}{name}"  # trim trailing sep if any and join
         return FlyteDirectory(path=new_path)
 
     @classmethod
@@ -343,18 +353,8 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
         Create a new FlyteDirectory object with the remote source set to the input
         """
         ctx = FlyteContextManager.current_context()
-        lit = Literal(
-            scalar=Scalar(
-                blob=Blob(
-                    metadata=BlobMetadata(
-                        type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.MULTIPART)
-                    ),
-                    uri=source,
-                )
-            )
-        )
-        t = FlyteDirToMultipartBlobTransformer()
-        return t.to_python_value(ctx, lit, cls)
+        lit = Literal(scalar=Scalar(blob=Blob(metadata=_EMPTY_FORMAT_MULTIPART_METADATA, uri=source)))
+        return _flyte_dir_transformer.to_python_value(ctx, lit, cls)
 
     def download(self) -> str:
         return self.__fspath__()
@@ -385,31 +385,35 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
         elif directory.remote_directory:
             final_path = typing.cast(os.PathLike, directory.remote_directory)
 
-        paths: typing.List[typing.Union[FlyteDirectory, FlyteFile]] = []
         file_access = FlyteContextManager.current_context().file_access
-        if not file_access.is_remote(final_path):
-            for p in os.listdir(final_path):
-                joined_path = os.path.join(final_path, p)
-                if os.path.isfile(joined_path):
-                    paths.append(FlyteFile(joined_path))
-                else:
-                    paths.append(FlyteDirectory(joined_path))
-            return paths
+        if not _is_remote(file_access, final_path):
+            # scandir reports the entry type from the directory listing itself, so unlike os.path.isfile this does not
+            # need an extra stat() per entry (symlinks are still followed).
+            with os.scandir(os.fspath(final_path)) as entries:
+                return [FlyteFile(e.path) if e.is_file() else FlyteDirectory(e.path) for e in entries]
+
+        paths: typing.List[typing.Union[FlyteDirectory, FlyteFile]] = []
 
         fs = file_access.get_filesystem_for_path(final_path)
+        get_data = file_access.get_data
+        # Random local paths generally share the sandbox as their parent, so only create each parent once.
+        created_parents: typing.Set[str] = set()
         for key in fs.listdir(final_path):
             remote_path = os.path.join(final_path, key["name"].split(os.sep)[-1])
             if key["type"] == "file":
                 local_path = file_access.get_random_local_path()
-                os.makedirs(pathlib.Path(local_path).parent, exist_ok=True)
-                downloader = partial(file_access.get_data, remote_path, local_path, is_multipart=False)
+                parent = os.path.dirname(local_path)
+                if parent not in created_parents:
+                    os.makedirs(parent, exist_ok=True)
+                    created_parents.add(parent)
+                downloader = partial(get_data, remote_path, local_path, is_multipart=False)
 
                 flyte_file: FlyteFile = FlyteFile(local_path, downloader=downloader)
                 flyte_file._remote_source = remote_path
                 paths.append(flyte_file)
             else:
                 local_folder = file_access.get_random_local_directory()
-                downloader = partial(file_access.get_data, remote_path, local_folder, is_multipart=True)
+                downloader = partial(get_data, remote_path, local_folder, is_multipart=True)
 
                 flyte_directory: FlyteDirectory = FlyteDirectory(path=local_folder, downloader=downloader)
                 flyte_directory._remote_source = remote_path
@@ -439,17 +443,31 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
             final_path = self.remote_source
         elif self.remote_directory:
             final_path = typing.cast(os.PathLike, self.remote_directory)
-        ctx = FlyteContextManager.current_context()
-        fs = ctx.file_access.get_filesystem_for_path(final_path)
+        file_access = FlyteContextManager.current_context().file_access
+        fs = file_access.get_filesystem_for_path(final_path)
         base_path_len = len(fsspec.core.strip_protocol(final_path)) + 1  # Add additional `/` at the end
+        if maxdepth is None and _is_remote(file_access, final_path):
+            # Object stores can list everything under a prefix in one paginated, delimiter-less listing, whereas walk
+            # issues one listing per "sub-directory". Files are yielded in listing order rather than walk order.
+            found = fs.find(final_path, **kwargs)
+            if isinstance(found, dict):
+                for name, v in found.items():
+                    yield final_path, {name[base_path_len:]: v}
+            else:
+                for name in found:
+                    yield final_path, name[base_path_len:]
+            return
+
         for base, _, files in fs.walk(final_path, maxdepth, topdown, **kwargs):
             current_base = base[base_path_len:]
+            # Equivalent to os.path.join(current_base, f), but the prefix is only built once per walked directory.
+            prefix = current_base + os.sep if current_base else ""
             if isinstance(files, dict):
                 for f, v in files.items():
-                    yield final_path, {os.path.join(current_base, f): v}
+                    yield final_path, {prefix + f: v}
             else:
                 for f in files:
-                    yield final_path, os.path.join(current_base, f)
+                    yield final_path, prefix + f
 
     def __repr__(self):
         return str(self.path)
@@ -465,6 +483,36 @@ class FlyteDirectory(SerializableType, DataClassJsonMixin, os.PathLike, typing.G
         return Path(self.path) / other
 
 
+@lru_cache(maxsize=None)
+def _specific_format_directory_class(item_string: str) -> typing.Type[FlyteDirectory]:
+    """
+    Builds the FlyteDirectory subclass for a given format. This is cached so that every FlyteDirectory["svg"] in type
+    hints, dataclass fields and transformer calls refers to the same class instead of creating a new one each time.
+    """
+
+    class _SpecificFormatDirectoryClass(FlyteDirectory):
+        # Get the type engine to see this as kind of a generic
+        __origin__ = FlyteDirectory
+
+        class AttributeHider:
+            def __get__(self, instance, owner):
+                raise AttributeError(
+                    """We have to return false in hasattr(cls, "__class_getitem__") to make mashumaro deserialize FlyteDirectory correctly."""
+                )
+
+        # Set __class_getitem__ to AttributeHider to make mashumaro deserialize FlyteDirectory correctly
+        # https://stackoverflow.com/questions/6057130/python-deleting-a-class-attribute-in-a-subclass/6057409
+        # Since mashumaro will use the method __class_getitem__ and __origin__ to construct the dataclass back
+        # https://github.com/Fatal1ty/mashumaro/blob/e945ee4319db49da9f7b8ede614e988cc8c8956b/mashumaro/core/meta/helpers.py#L300-L303
+        __class_getitem__ = AttributeHider()  # type: ignore
+
+        @classmethod
+        def extension(cls) -> str:
+            return item_string
+
+    return _SpecificFormatDirectoryClass
+
+
 class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
     """
     This transformer handles conversion between the Python native FlyteDirectory class defined above, and the Flyte
@@ -484,6 +532,7 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
         return t.extension()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _blob_type(format: str) -> _core_types.BlobType:
         return _core_types.BlobType(format=format, dimensionality=_core_types.BlobType.BlobDimensionality.MULTIPART)
 
@@ -509,9 +558,10 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
         python_type: typing.Type[FlyteDirectory],
         expected: LiteralType,
     ) -> Literal:
+        file_access = ctx.file_access
         remote_directory = None
         should_upload = True
-        batch_size = get_batch_size(python_type)
+        is_known_dir = False
 
         meta = BlobMetadata(type=self._blob_type(format=self.get_format(python_type)))
 
@@ -530,7 +580,7 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
             #   blob store doesn't make sense.
             if not isinstance(python_val.remote_directory, (pathlib.Path, str)) and (
                 python_val.remote_directory is False
-                or ctx.file_access.is_remote(source_path)
+                or _is_remote(file_access, source_path)
                 or ctx.execution_state.is_local_execution()
             ):
                 should_upload = False
@@ -542,24 +592,26 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
         elif isinstance(python_val, (pathlib.Path, str)):
             source_path = str(python_val)
 
-            if ctx.file_access.is_remote(source_path):
+            if _is_remote(file_access, source_path):
                 should_upload = False
             else:
-                p = Path(source_path)
-                if not p.is_dir():
+                if not os.path.isdir(source_path):
                     raise ValueError(f"Expected a directory. {source_path} is not a directory")
+                is_known_dir = True
         else:
             raise AssertionError(f"Expected FlyteDirectory or os.PathLike object, received {type(python_val)}")
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
             if remote_directory is None:
-                remote_directory = ctx.file_access.get_random_remote_directory()
-            if not pathlib.Path(source_path).is_dir():
+                remote_directory = file_access.get_random_remote_directory()
+            # A single stat, skipped when the string case above already checked the same path.
+            if not is_known_dir and not os.path.isdir(source_path):
                 raise FlyteAssertion("Expected a directory. {} is not a directory".format(source_path))
             # remote_directory will convert the path from `flyte://` to `s3://` or `gs://`
-            remote_directory = await ctx.file_access.async_put_data(
-                source_path, remote_directory, is_multipart=True, batch_size=batch_size
+            # For async filesystems (s3fs, gcsfs, ...) fsspec uploads the files concurrently, batch_size at a time.
+            remote_directory = await file_access.async_put_data(
+                source_path, remote_directory, is_multipart=True, batch_size=get_batch_size(python_type)
             )
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)))
 
@@ -575,22 +627,9 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
         if path is None:
             raise ValueError("FlyteDirectory's path should not be None")
 
-        return self.to_python_value(
-            FlyteContextManager.current_context(),
-            Literal(
-                scalar=Scalar(
-                    blob=Blob(
-                        metadata=BlobMetadata(
-                            type=_core_types.BlobType(
-                                format="", dimensionality=_core_types.BlobType.BlobDimensionality.MULTIPART
-                            )
-                        ),
-                        uri=path,
-                    )
-                )
-            ),
-            expected_python_type,
-        )
+        # Equivalent to to_python_value on a format-less multipart blob literal, without building the literal or
+        # round-tripping through the event loop.
+        return self._uri_to_python_value(FlyteContextManager.current_context(), path, expected_python_type)
 
     def from_binary_idl(
         self, binary_idl_object: Binary, expected_python_type: typing.Type[FlyteDirectory]
@@ -649,42 +688,48 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
         - Title: Override Dataclass Serialization/Deserialization Behavior for FlyteTypes via Mashumaro
         - Link: https://github.com/flyteorg/flytekit/pull/2554
         """
-        json_str = _json_format.MessageToJson(generic)
-        python_val = json.loads(json_str)
+        python_val = _json_format.MessageToDict(generic)
         return self.dict_to_flyte_directory(python_val, expected_python_type)
 
     async def async_to_python_value(
         self, ctx: FlyteContext, lv: Literal, expected_python_type: typing.Type[FlyteDirectory]
     ) -> FlyteDirectory:
+        scalar = lv.scalar
         # Handle dataclass attribute access
-        if lv.scalar:
-            if lv.scalar.binary:
-                return self.from_binary_idl(lv.scalar.binary, expected_python_type)
-            if lv.scalar.generic:
-                return self.from_generic_idl(lv.scalar.generic, expected_python_type)
-
-        try:
-            uri = lv.scalar.blob.uri
-        except AttributeError:
+        if scalar:
+            if scalar.binary:
+                return self.from_binary_idl(scalar.binary, expected_python_type)
+            if scalar.generic:
+                return self.from_generic_idl(scalar.generic, expected_python_type)
+
+        blob = scalar.blob if scalar else None
+        if blob is None:
             raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
-        if lv.scalar.blob.metadata.type.dimensionality != BlobType.BlobDimensionality.MULTIPART:
-            raise TypeTransformerFailedError(f"{lv.scalar.blob.uri} is not a directory.")
+        uri = blob.uri
+        if blob.metadata.type.dimensionality != BlobType.BlobDimensionality.MULTIPART:
+            raise TypeTransformerFailedError(f"{uri} is not a directory.")
 
-        if not ctx.file_access.is_remote(uri) and not os.path.isdir(uri):
-            raise FlyteAssertion(f"Expected a directory, but the given uri '{uri}' is not a directory.")
+        return self._uri_to_python_value(ctx, uri, expected_python_type)
+
+    def _uri_to_python_value(
+        self, ctx: FlyteContext, uri: str, expected_python_type: typing.Type[FlyteDirectory]
+    ) -> FlyteDirectory:
+        file_access = ctx.file_access
 
         # This is a local file path, like /usr/local/my_dir, don't mess with it. Certainly, downloading it doesn't
-        # make any sense.
-        if not ctx.file_access.is_remote(uri):
+        # make any sense. Only local paths are stat'ed, remote uris go straight to the lazy downloader below.
+        if not _is_remote(file_access, uri):
+            if not os.path.isdir(uri):
+                raise FlyteAssertion(f"Expected a directory, but the given uri '{uri}' is not a directory.")
             return expected_python_type(uri, remote_directory=False)
 
         # For the remote case, return a FlyteDirectory object that can download
-        local_folder = ctx.file_access.get_random_local_directory()
+        local_folder = file_access.get_random_local_directory()
 
         batch_size = get_batch_size(expected_python_type)
 
-        _downloader = partial(ctx.file_access.get_data, uri, local_folder, is_multipart=True, batch_size=batch_size)
+        _downloader = partial(file_access.get_data, uri, local_folder, is_multipart=True, batch_size=batch_size)
 
         expected_format = self.get_format(expected_python_type)
 
@@ -701,4 +746,7 @@ class FlyteDirToMultipartBlobTransformer(AsyncTypeTransformer[FlyteDirectory]):
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
 
-TypeEngine.register(FlyteDirToMultipartBlobTransformer())
+# The transformer is stateless, so FlyteDirectory reuses the registered instance instead of constructing a new one
+# every time it (de)serializes itself.
+_flyte_dir_transformer = FlyteDirToMultipartBlobTransformer()
+TypeEngine.register(_flyte_dir_transformer)
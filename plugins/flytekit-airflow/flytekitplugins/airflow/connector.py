@@ -1,6 +1,7 @@
 import asyncio
 import typing
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Optional
 
 import cloudpickle
@@ -19,6 +20,12 @@ from flytekit.extend.backend.base_connector import AsyncConnectorBase, Connector
 from flytekit.models.literals import LiteralMap
 from flytekit.models.task import TaskTemplate
 
+if typing.TYPE_CHECKING:
+    from airflow.providers.google.cloud.operators.dataproc import DataprocSubmitTrigger
+
+# Attributes set by airflow's BaseTrigger itself, which are not arguments of the trigger's constructor.
+_BASE_TRIGGER_ATTRIBUTES = frozenset({"task_instance", "trigger_id"})
+
 
 @dataclass
 class AirflowMetadata(ResourceMeta):
@@ -78,10 +85,8 @@ class AirflowConnector(AsyncConnectorBase):
                 resource_meta = AirflowMetadata(airflow_operator=airflow_obj)
                 airflow_instance.execute(context=Context())
             except TaskDeferred as td:
-                parameters = td.trigger.__dict__.copy()
-                # Remove parameters that are in the base class
-                parameters.pop("task_instance", None)
-                parameters.pop("trigger_id", None)
+                # Drop parameters that are in the base class
+                parameters = {k: v for k, v in td.trigger.__dict__.items() if k not in _BASE_TRIGGER_ATTRIBUTES}
 
                 resource_meta.airflow_trigger = AirflowObj(
                     module=td.trigger.__module__, name=td.trigger.__class__.__name__, parameters=parameters
@@ -148,20 +153,30 @@ class AirflowConnector(AsyncConnectorBase):
 def get_log_links(
     airflow_operator: BaseOperator, airflow_trigger: Optional[BaseTrigger] = None
 ) -> Optional[List[TaskLog]]:
-    log_links: List[TaskLog] = []
+    dataproc_job_operator = _get_dataproc_job_operator()
+    if dataproc_job_operator is not None and isinstance(airflow_operator, dataproc_job_operator):
+        job_id = typing.cast("DataprocSubmitTrigger", airflow_trigger).job_id
+        log_link = TaskLog(
+            uri=f"https://console.cloud.google.com/dataproc/jobs/{job_id}/monitoring?region={airflow_operator.region}&project={airflow_operator.project_id}",
+            name="Dataproc Console",
+        )
+        return [log_link]
+    # Resource.log_links is optional, so there's no need to build an empty list on every poll.
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_dataproc_job_operator() -> Optional[type]:
+    """
+    The google provider is optional and heavy to import, so it's looked up on the first poll instead of at import
+    time, and a missing provider is only discovered once.
+    """
     try:
-        from airflow.providers.google.cloud.operators.dataproc import DataprocJobBaseOperator, DataprocSubmitTrigger
-
-        if isinstance(airflow_operator, DataprocJobBaseOperator):
-            log_link = TaskLog(
-                uri=f"https://console.cloud.google.com/dataproc/jobs/{typing.cast(DataprocSubmitTrigger, airflow_trigger).job_id}/monitoring?region={airflow_operator.region}&project={airflow_operator.project_id}",
-                name="Dataproc Console",
-            )
-            log_links.append(log_link)
-            return log_links
+        from airflow.providers.google.cloud.operators.dataproc import DataprocJobBaseOperator
+
+        return DataprocJobBaseOperator
     except ImportError:
-        ...
-    return log_links
+        return None
 
 
 ConnectorRegistry.register(AirflowConnector())
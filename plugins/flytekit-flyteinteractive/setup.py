@@ -1,4 +1,4 @@
-from setuptools import setup
+from setuptools import find_namespace_packages, setup
 
 PLUGIN_NAME = "flyteinteractive"
 
@@ -16,12 +16,7 @@ setup(
     author="flyteorg",
     author_email="admin@flyte.org",
     description="This package holds the flyteinteractive plugins for flytekit",
-    namespace_packages=["flytekitplugins"],
-    packages=[
-        f"flytekitplugins.{PLUGIN_NAME}",
-        f"flytekitplugins.{PLUGIN_NAME}.vscode_lib",
-        f"flytekitplugins.{PLUGIN_NAME}.jupyter_lib",
-    ],
+    packages=find_namespace_packages(include=[f"flytekitplugins.{PLUGIN_NAME}", f"flytekitplugins.{PLUGIN_NAME}.*"]),
     install_requires=plugin_requires,
     license="apache2",
     python_requires=">=3.9",
@@ -4,6 +4,10 @@ from kubernetes.client import V1Container, V1EmptyDirVolumeSource, V1PodSpec, V1
 
 from flytekit.core.pod_template import PodTemplate
 
+# Set on pod templates this module has already added the shared memory volume to, so that a template shared between
+# several tasks is only configured once.
+_SHM_INJECTED_ATTR = "_shm_injected"
+
 
 def add_shared_mem_volume_to_pod_template(pod_template: PodTemplate) -> None:
     """Add shared memory volume and volume mount to the pod template."""
@@ -13,6 +17,9 @@ def add_shared_mem_volume_to_pod_template(pod_template: PodTemplate) -> None:
         "`PyTorch(..., increase_shared_mem=True)` is deprecated. Use `@task(shared_memory=True)` instead."
     )
 
+    if getattr(pod_template, _SHM_INJECTED_ATTR, False):
+        return
+
     mount_path = "/dev/shm"
     shm_volume = V1Volume(name="shm", empty_dir=V1EmptyDirVolumeSource(medium="Memory"))
     shm_volume_mount = V1VolumeMount(name="shm", mount_path=mount_path)
@@ -23,11 +30,6 @@ def add_shared_mem_volume_to_pod_template(pod_template: PodTemplate) -> None:
     if pod_template.pod_spec.containers is None:
         pod_template.pod_spec.containers = []
 
-    if pod_template.pod_spec.volumes is None:
-        pod_template.pod_spec.volumes = []
-
-    pod_template.pod_spec.volumes.append(shm_volume)
-
     num_containers = len(pod_template.pod_spec.containers)
 
     if num_containers >= 2:
@@ -37,19 +39,27 @@ def add_shared_mem_volume_to_pod_template(pod_template: PodTemplate) -> None:
             "container yourself."
         )
 
+    # Validate before mutating anything so that a rejected pod template is left as the user passed it.
+    if num_containers == 1 and pod_template.pod_spec.containers[0].volume_mounts:
+        has_shared_mem_vol_mount = any(
+            [v.mount_path == mount_path for v in pod_template.pod_spec.containers[0].volume_mounts]
+        )
+        if has_shared_mem_vol_mount:
+            raise ValueError(
+                "A shared memory volume mount is already configured in the pod template. "
+                "Please remove the volume mount or set `increase_shared_mem=False` in the task config."
+            )
+
+    if pod_template.pod_spec.volumes is None:
+        pod_template.pod_spec.volumes = []
+
+    pod_template.pod_spec.volumes.append(shm_volume)
+
     if num_containers != 1:
         pod_template.pod_spec.containers.append(V1Container(name="primary"))
 
     if pod_template.pod_spec.containers[0].volume_mounts is None:
         pod_template.pod_spec.containers[0].volume_mounts = []
 
-    has_shared_mem_vol_mount = any(
-        [v.mount_path == mount_path for v in pod_template.pod_spec.containers[0].volume_mounts]
-    )
-    if has_shared_mem_vol_mount:
-        raise ValueError(
-            "A shared memory volume mount is already configured in the pod template. "
-            "Please remove the volume mount or set `increase_shared_mem=False` in the task config."
-        )
-
     pod_template.pod_spec.containers[0].volume_mounts.append(shm_volume_mount)
+    setattr(pod_template, _SHM_INJECTED_ATTR, True)
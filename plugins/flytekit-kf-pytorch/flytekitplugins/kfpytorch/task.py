@@ -307,16 +307,21 @@ def spawn_helper(
 def _convert_run_policy_to_flyte_idl(
     run_policy: RunPolicy,
 ) -> kubeflow_common.RunPolicy:
+    scheduling_policy = (
+        kubeflow_common.SchedulingPolicy(
+            queue=run_policy.scheduling_policy.queue,
+            priority_class=run_policy.scheduling_policy.priority_class,
+            min_available=run_policy.scheduling_policy.min_available,
+        )
+        if run_policy.scheduling_policy
+        else None
+    )
     return kubeflow_common.RunPolicy(
         clean_pod_policy=run_policy.clean_pod_policy.value if run_policy.clean_pod_policy else None,
         ttl_seconds_after_finished=run_policy.ttl_seconds_after_finished,
         active_deadline_seconds=run_policy.active_deadline_seconds,
         backoff_limit=run_policy.backoff_limit,
-        scheduling_policy=kubeflow_common.SchedulingPolicy(
-            queue=run_policy.scheduling_policy.queue if run_policy.scheduling_policy else None,
-            priority_class=run_policy.scheduling_policy.priority_class if run_policy.scheduling_policy else None,
-            min_available=run_policy.scheduling_policy.min_available if run_policy.scheduling_policy else None,
-        ),
+        scheduling_policy=scheduling_policy,
         suspend=run_policy.suspend,
     )
 
@@ -406,8 +411,11 @@ class PytorchElasticFunctionTask(PythonFunctionTask[Elastic]):
             )
             os.environ["OMP_NUM_THREADS"] = str(omp_num_threads)
 
+        # Resolved once for the launch config, the spawn arguments and the rank zero result handling below.
+        ctx = flytekit.current_context()
+
         config = LaunchConfig(
-            run_id=flytekit.current_context().execution_id.name,
+            run_id=ctx.execution_id.name,
             min_nodes=self.min_nodes,
             max_nodes=self.max_nodes,
             nproc_per_node=self.task_config.nproc_per_node,
@@ -430,7 +438,6 @@ class PytorchElasticFunctionTask(PythonFunctionTask[Elastic]):
 
             dumped_target_function = cloudpickle.dumps(self._task_function)
 
-            ctx = flytekit.current_context()
             try:
                 checkpoint_dest = ctx.checkpoint._checkpoint_dest
                 checkpoint_src = ctx.checkpoint._checkpoint_src
@@ -449,34 +456,12 @@ class PytorchElasticFunctionTask(PythonFunctionTask[Elastic]):
         elif self.task_config.start_method == "fork":
             """
             The torch elastic launcher doesn't support passing kwargs to the target function,
-            only args. Flyte only works with kwargs. Thus, we create a closure which already has
-            the task kwargs bound. We tell the torch elastic launcher to start this function in
-            the child processes.
+            only args. Flyte only works with kwargs. Thus, we pass the task kwargs as a single
+            positional argument to `_fork_entrypoint`, which the torch elastic launcher starts
+            in the child processes.
             """
-
-            def fn_partial():
-                """Closure of the task function with kwargs already bound."""
-                try:
-                    return_val = self._task_function(**kwargs)
-                    core_context = FlyteContextManager.current_context()
-                    omt = core_context.output_metadata_tracker
-                    om = None
-                    if omt:
-                        om = omt.get(return_val)
-                except Exception as e:
-                    # See explanation in `create_recoverable_error_file` why we check
-                    # for recoverable errors here in the worker processes.
-                    if isinstance(e, FlyteRecoverableException):
-                        create_recoverable_error_file()
-                    raise
-                return ElasticWorkerResult(
-                    return_value=return_val,
-                    decks=flytekit.current_context().decks,
-                    om=om,
-                )
-
-            launcher_target_func = fn_partial
-            launcher_args = ()
+            launcher_target_func = self._fork_entrypoint
+            launcher_args = (kwargs,)
 
         else:
             raise ValueError("Bad start method")
@@ -505,7 +490,6 @@ class PytorchElasticFunctionTask(PythonFunctionTask[Elastic]):
         # Rank 0 returns the result of the task function
         if 0 in out:
             # For rank 0, we transfer the decks created in the worker process to the parent process
-            ctx = flytekit.current_context()
             for deck in out[0].decks:
                 if not isinstance(deck, flytekit.deck.deck.TimeLineDeck):
                     ctx.decks.append(deck)
@@ -517,6 +501,27 @@ class PytorchElasticFunctionTask(PythonFunctionTask[Elastic]):
         else:
             raise IgnoreOutputs()
 
+    def _fork_entrypoint(self, kwargs: Dict[str, Any]) -> ElasticWorkerResult:
+        """Runs the task function with the task kwargs in a worker process started with the `fork` start method."""
+        try:
+            return_val = self._task_function(**kwargs)
+            core_context = FlyteContextManager.current_context()
+            omt = core_context.output_metadata_tracker
+            om = None
+            if omt:
+                om = omt.get(return_val)
+        except Exception as e:
+            # See explanation in `create_recoverable_error_file` why we check
+            # for recoverable errors here in the worker processes.
+            if isinstance(e, FlyteRecoverableException):
+                create_recoverable_error_file()
+            raise
+        return ElasticWorkerResult(
+            return_value=return_val,
+            decks=flytekit.current_context().decks,
+            om=om,
+        )
+
     def execute(self, **kwargs) -> Any:
         """
         This method will be invoked to execute the task.
@@ -534,9 +539,7 @@ class PytorchElasticFunctionTask(PythonFunctionTask[Elastic]):
             """
             return super().get_custom(settings)
         else:
-            from flyteidl.plugins.kubeflow.pytorch_pb2 import ElasticConfig
-
-            elastic_config = ElasticConfig(
+            elastic_config = pytorch_task.ElasticConfig(
                 rdzv_backend=self.rdzv_backend,
                 min_replicas=self.min_nodes,
                 max_replicas=self.max_nodes,
@@ -1,5 +1,13 @@
 import pytest
-from flytekitplugins.kfpytorch.task import CleanPodPolicy, Master, PyTorch, RestartPolicy, RunPolicy, Worker
+from flytekitplugins.kfpytorch.task import (
+    CleanPodPolicy,
+    Master,
+    PyTorch,
+    RestartPolicy,
+    RunPolicy,
+    SchedulingPolicy,
+    Worker,
+)
 
 from flytekit import Resources, task
 from flytekit.configuration import Image, ImageConfig, SerializationSettings
@@ -141,3 +149,25 @@ def test_pytorch_task_with_custom_config(serialization_settings: SerializationSe
         },
     }
     assert my_pytorch_task.get_custom(serialization_settings) == expected_custom_dict
+
+
+def test_pytorch_task_scheduling_policy(serialization_settings: SerializationSettings):
+    @task(task_config=PyTorch(worker=Worker(replicas=2), run_policy=RunPolicy(backoff_limit=1)))
+    def without_scheduling_policy() -> None:
+        pass
+
+    # An unset scheduling policy is left out of the run policy instead of being sent as an empty message
+    assert without_scheduling_policy.get_custom(serialization_settings)["runPolicy"] == {"backoffLimit": 1}
+
+    @task(
+        task_config=PyTorch(
+            worker=Worker(replicas=2),
+            run_policy=RunPolicy(scheduling_policy=SchedulingPolicy(queue="gpu", min_available=3)),
+        )
+    )
+    def with_scheduling_policy() -> None:
+        pass
+
+    assert with_scheduling_policy.get_custom(serialization_settings)["runPolicy"] == {
+        "schedulingPolicy": {"queue": "gpu", "minAvailable": 3},
+    }
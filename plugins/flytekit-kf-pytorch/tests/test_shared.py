@@ -162,3 +162,20 @@ def test_native_task_arg():
         pass
 
     assert test_task_pytorch.pod_template is None
+
+
+def test_shared_pod_template_gets_one_shm_volume():
+    """Test that a pod template shared by several tasks only gets the shared memory volume once."""
+    pod_template = PodTemplate()
+
+    @task(task_config=Elastic(nnodes=2, increase_shared_mem=True), pod_template=pod_template)
+    def first_task() -> None:
+        pass
+
+    @task(task_config=PyTorch(num_workers=3, increase_shared_mem=True), pod_template=pod_template)
+    def second_task() -> None:
+        pass
+
+    assert len(pod_template.pod_spec.volumes) == 1
+    assert len(pod_template.pod_spec.containers) == 1
+    assert len(pod_template.pod_spec.containers[0].volume_mounts) == 1
@@ -29,3 +29,17 @@ def test_listdir():
         return map_task(read_file)(file=files)
 
     assert wf() == ["Hello, World!"]
+
+
+def test_listdir_local_entry_types(tmp_path):
+    (tmp_path / "file.txt").write_text("Hello, World!")
+    (tmp_path / "sub_dir").mkdir()
+    (tmp_path / "link.txt").symlink_to(tmp_path / "file.txt")
+
+    entries = {Path(e.path).name: e for e in FlyteDirectory.listdir(FlyteDirectory(tmp_path))}
+
+    assert set(entries) == {"file.txt", "sub_dir", "link.txt"}
+    assert type(entries["file.txt"]) is FlyteFile
+    assert type(entries["link.txt"]) is FlyteFile
+    assert type(entries["sub_dir"]) is FlyteDirectory
+    assert entries["sub_dir"].path == str(tmp_path / "sub_dir")
@@ -1,7 +1,17 @@
+import asyncio
+import json
+import os
+import pathlib
+import pickle
+from dataclasses import dataclass
+
+import fsspec
 import mock
+from dataclasses_json import DataClassJsonMixin
 
 from flytekit import FlyteContext, FlyteContextManager
 from flytekit.types.directory import FlyteDirectory
+from flytekit.types.directory.types import _fast_is_remote
 from flytekit.types.file import FlyteFile
 
 
@@ -43,3 +53,76 @@ def test_sep_nt():
     assert fd.sep == "\\"
     fd = FlyteDirectory(path="s3://mypath")
     assert fd.sep == "/"
+
+
+def test_crawl_remote_matches_walk():
+    fs = fsspec.filesystem("memory")
+    fs.pipe({"memory://crawl-bucket/root/a.txt": b"a", "memory://crawl-bucket/root/nested/deeper/b.txt": b"b"})
+    try:
+        fd = FlyteDirectory(path="memory://crawl-bucket/root")
+        expected = [("memory://crawl-bucket/root", "a.txt"), ("memory://crawl-bucket/root", "nested/deeper/b.txt")]
+        # Without maxdepth the prefix is listed in one go, with maxdepth fs.walk is used
+        assert sorted(fd.crawl()) == expected
+        assert sorted(fd.crawl(maxdepth=10)) == expected
+
+        detailed = dict(kv for _, d in fd.crawl(detail=True) for kv in d.items())
+        assert set(detailed) == {"a.txt", "nested/deeper/b.txt"}
+        assert detailed["a.txt"]["size"] == 1
+    finally:
+        fs.rm("memory://crawl-bucket", recursive=True)
+
+
+def test_specific_format_class_is_cached():
+    svg_dir = FlyteDirectory["svg"]
+    assert svg_dir is FlyteDirectory[".svg"]
+    assert svg_dir is not FlyteDirectory["png"]
+    assert svg_dir.extension() == "svg"
+    assert FlyteDirectory[""] is FlyteDirectory
+
+
+def test_fast_is_remote_agrees_with_file_access():
+    file_access = FlyteContextManager.current_context().file_access
+    for p in ["s3://bucket/dir", "gs://bucket/dir", "https://host/dir", "/tmp/local/dir"]:
+        assert _fast_is_remote(p) is file_access.is_remote(p)
+    # Anything else is left to the file access provider
+    assert _fast_is_remote("file:///tmp/dir") is None
+    assert _fast_is_remote("relative/dir") is None
+    assert _fast_is_remote(pathlib.Path("/tmp")) is None
+
+
+def test_serialize_remote_path_skips_transformer():
+    with mock.patch("flytekit.types.directory.types._flyte_dir_transformer.to_literal") as to_literal:
+        assert FlyteDirectory(path="s3://bucket/dir")._serialize() == {"path": "s3://bucket/dir"}
+        fd = FlyteDirectory(path="/tmp/local")
+        fd._remote_source = "gs://bucket/dir"
+        assert fd._serialize() == {"path": "gs://bucket/dir"}
+        to_literal.assert_not_called()
+
+
+def test_remote_directory_downloader_survives_pickle():
+    fd = FlyteDirectory.from_source("s3://bucket/dir")
+    # The local folder exists before download, and after a round trip through pickle (as done for elastic tasks
+    # started with `spawn`) the downloader is still recognized as a coroutine function by __fspath__.
+    assert os.path.isdir(fd.path)
+    restored = pickle.loads(pickle.dumps(fd))
+    assert asyncio.iscoroutinefunction(restored._downloader.func)
+
+
+@dataclass
+class _DirHolder(DataClassJsonMixin):
+    fd: FlyteDirectory
+
+
+def test_flyte_directory_json_round_trip():
+    # dataclasses_json containers serialize the nested FlyteDirectory by its fields
+    holder = _DirHolder(fd=FlyteDirectory("s3://bucket/dir"))
+    assert json.loads(holder.to_json()) == {"fd": {"path": "s3://bucket/dir"}}
+    restored = _DirHolder.from_json(holder.to_json())
+    assert isinstance(restored.fd, FlyteDirectory)
+    assert restored.fd.path == "s3://bucket/dir"
+
+    # FlyteDirectory's own mashumaro to_dict/from_json are field based too, and don't go through _deserialize
+    assert FlyteDirectory("s3://bucket/dir").to_dict() == {"path": "s3://bucket/dir"}
+    fd = FlyteDirectory.from_json('{"path": "s3://bucket/dir"}')
+    assert fd.path == "s3://bucket/dir"
+    assert fd.remote_source is None